@@ -0,0 +1,304 @@
+"""
+Persistent Experiment Cache
+===========================
+
+Disk-backed, content-addressed cache for the security experiments in
+``experimental_security_analysis``. Each entry is keyed by a SHA-256 hash of
+(experiment name, plaintext, graph key, parameters, code version), so a
+sweep over graph sizes and message lengths only recomputes the grid points
+whose inputs or code actually changed.
+
+All entries live in a single compressed ``.npz`` file laid out by column.
+String columns (keys, experiment names, JSON-encoded results) are stored as
+one concatenated UTF-8 ``uint8`` buffer plus a lengths column, so a single
+large result does not pad every other row; timings and access times are
+``float64`` columns. ``max_bytes`` bounds the uncompressed size of these
+columns (the in-memory footprint and an upper bound on the file payload);
+when it is exceeded the least recently used entries are evicted. New entries are kept in memory and written out by ``flush()``
+(and automatically every ``flush_every`` puts).
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+
+
+DEFAULT_CACHE_DIR = '.experiment_cache'
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_FLUSH_EVERY = 50
+CACHE_FILENAME = 'results.npz'
+
+_STRING_COLUMNS = ('keys', 'experiments', 'results')
+_FLOAT_COLUMNS = ('compute_times', 'accessed')
+# Per-row bytes outside the string buffers: three int64 lengths, two float64s
+_ROW_OVERHEAD = 3 * 8 + 2 * 8
+
+
+def _to_builtin(value):
+    """JSON fallback for numpy scalars and arrays."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _pack(strings):
+    """Encode strings into one ``uint8`` buffer and an ``int64`` lengths column."""
+    encoded = [text.encode('utf-8') for text in strings]
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    lengths = np.array([len(item) for item in encoded], dtype=np.int64)
+    return data, lengths
+
+
+def _unpack(data, lengths):
+    """Inverse of ``_pack``."""
+    if (lengths < 0).any() or int(lengths.sum()) != len(data):
+        raise ValueError("string column lengths do not match its data")
+    raw = data.tobytes()
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    return [raw[start:end].decode('utf-8') for start, end in zip(starts, ends)]
+
+
+def _entry_size(key, experiment, encoded_result):
+    """Bytes one entry occupies in the written columns."""
+    return (len(key.encode('utf-8')) + len(experiment.encode('utf-8'))
+            + len(encoded_result.encode('utf-8')) + _ROW_OVERHEAD)
+
+
+def code_version(*objects):
+    """
+    Hash the source code of the given functions/classes.
+
+    Any edit to the cipher or to an experiment routine changes this value,
+    which invalidates only the entries produced by that code.
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        try:
+            source = inspect.getsource(obj)
+        except (OSError, TypeError):
+            source = getattr(obj, '__qualname__', repr(obj))
+        digest.update(source.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class ExperimentCache:
+    """
+    Content-addressed, size-bounded store for experiment result dicts.
+
+    ``max_bytes`` limits the total uncompressed size of all columns
+    (string bytes, lengths and float columns), not just the results.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 flush_every=DEFAULT_FLUSH_EVERY):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.flush_every = flush_every
+        self.path = os.path.join(cache_dir, CACHE_FILENAME)
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._total_bytes = 0
+        self._pending_puts = 0
+        self._dirty = False
+        self._load()
+
+    # ============================================================
+    # KEYS
+    # ============================================================
+
+    @staticmethod
+    def make_key(experiment, plaintext, graph_key, params=None, version=''):
+        """
+        Build the content hash for one experiment run.
+
+        Args:
+            experiment: Experiment name, e.g. 'brute_force_graph'
+            plaintext: The plaintext the experiment encrypts
+            graph_key: Tuple of (adjacency_matrix, key1), or None for Caesar
+            params: Dict of extra parameters (max_attempts, seed, ...)
+            version: Code version string, see ``code_version``
+        """
+        if graph_key is not None:
+            adjacency_matrix, key1 = graph_key
+            graph_key = [np.asarray(adjacency_matrix).tolist(), int(key1)]
+        payload = json.dumps(
+            [experiment, plaintext, graph_key, params or {}, version],
+            sort_keys=True, default=_to_builtin, separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    # ============================================================
+    # LOOKUP / STORE
+    # ============================================================
+
+    def get(self, key):
+        """
+        Return the cached result dict for ``key``, or None on a miss.
+
+        A stored result may itself be None; use ``key in cache`` to tell
+        the two apart.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry['accessed'] = time.time()
+        self._dirty = True
+        return json.loads(entry['result'])
+
+    def put(self, key, experiment, result, compute_time):
+        """
+        Store a result dict and the wall-clock time it took to compute.
+
+        Entries beyond ``max_bytes`` are evicted least-recently-used first.
+        The file is only rewritten every ``flush_every`` puts; call
+        ``flush()`` once the experiment is done.
+        """
+        encoded = json.dumps(result, sort_keys=True, default=_to_builtin)
+        size = _entry_size(key, experiment, encoded)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= previous['size']
+        self._total_bytes += size
+        self._entries[key] = {
+            'experiment': experiment,
+            'result': encoded,
+            'compute_time': float(compute_time),
+            'size': size,
+            'accessed': time.time(),
+        }
+        self._evict()
+        self._dirty = True
+        self._pending_puts += 1
+        if self.flush_every and self._pending_puts >= self.flush_every:
+            self.flush()
+
+    def get_or_compute(self, key, experiment, compute):
+        """
+        Return the cached result for ``key``, calling ``compute()`` on a miss.
+
+        Returns:
+            (result, hit) where hit is True if the result came from disk
+        """
+        # Check membership rather than the value so a cached None is a hit
+        if key in self._entries:
+            return self.get(key), True
+        self.misses += 1
+        start_time = time.perf_counter()
+        result = compute()
+        self.put(key, experiment, result, time.perf_counter() - start_time)
+        return result, False
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def compute_time(self, key):
+        """Wall-clock seconds the original computation of ``key`` took."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry['compute_time']
+
+    def clear(self):
+        """Drop every entry and remove the cache file."""
+        self._entries = {}
+        self._total_bytes = 0
+        self._pending_puts = 0
+        self._dirty = False
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    # ============================================================
+    # PERSISTENCE
+    # ============================================================
+
+    def _evict(self):
+        if self._total_bytes <= self.max_bytes:
+            return
+        by_age = sorted(self._entries, key=lambda k: self._entries[k]['accessed'])
+        for key in by_age:
+            self._total_bytes -= self._entries.pop(key)['size']
+            self._dirty = True
+            if self._total_bytes <= self.max_bytes:
+                break
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                strings = [(data[name + '_data'], data[name + '_lengths'])
+                           for name in _STRING_COLUMNS]
+                floats = [data[name] for name in _FLOAT_COLUMNS]
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            # Corrupt or outdated file: start over rather than fail the run
+            return
+        lengths = {len(column) for column in floats}
+        lengths.update(len(column_lengths) for _, column_lengths in strings)
+        if len(lengths) != 1:
+            return
+        try:
+            keys, experiments, results = (_unpack(*column) for column in strings)
+            columns = list(zip(keys, experiments, results, *floats))
+        except (ValueError, UnicodeDecodeError):
+            return
+        for key, experiment, result, compute_time, accessed in columns:
+            size = _entry_size(key, experiment, result)
+            self._entries[key] = {
+                'experiment': experiment,
+                'result': result,
+                'compute_time': float(compute_time),
+                'size': size,
+                'accessed': float(accessed),
+            }
+            self._total_bytes += size
+        # The file may predate a smaller budget
+        self._evict()
+
+    def flush(self):
+        """Write pending changes (new entries, access times) to disk."""
+        if not self._dirty:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        keys = list(self._entries)
+        entries = [self._entries[k] for k in keys]
+        columns = {}
+        for name, values in (('keys', keys),
+                             ('experiments', [e['experiment'] for e in entries]),
+                             ('results', [e['result'] for e in entries])):
+            columns[name + '_data'], columns[name + '_lengths'] = _pack(values)
+        columns['compute_times'] = np.array([e['compute_time'] for e in entries], dtype=np.float64)
+        columns['accessed'] = np.array([e['accessed'] for e in entries], dtype=np.float64)
+        # Write to a temp file and swap it in so an interrupted run
+        # never leaves a half-written cache behind
+        fd, tmp_path = tempfile.mkstemp(suffix='.npz', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                np.savez_compressed(fh, **columns)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._dirty = False
+        self._pending_puts = 0
@@ -0,0 +1,164 @@
+"""Tests for the persistent experiment cache."""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from experiment_cache import CACHE_FILENAME, ExperimentCache, code_version
+
+
+MATRIX = [[1, 1], [0, 1]]
+
+
+def test_round_trip_across_instances(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    key = cache.make_key('brute_force_graph', 'HELLO', (MATRIX, 4), {'seed': 0})
+    cache.put(key, 'brute_force_graph', {'attempts': 10, 'success': False}, 0.25)
+    cache.flush()
+
+    reloaded = ExperimentCache(str(tmp_path))
+    assert len(reloaded) == 1
+    assert reloaded.get(key) == {'attempts': 10, 'success': False}
+    assert reloaded.compute_time(key) == pytest.approx(0.25)
+    assert reloaded.total_bytes == cache.total_bytes
+
+
+def test_lru_eviction_under_max_bytes(tmp_path):
+    result = {'v': 'x' * 40}
+    keys = [ExperimentCache.make_key('e', str(i), None) for i in range(4)]
+    probe = ExperimentCache(str(tmp_path / 'probe'))
+    probe.put(keys[0], 'e', result, 0.0)
+    cache = ExperimentCache(str(tmp_path), max_bytes=3 * probe.total_bytes)
+
+    for key in keys[:3]:
+        cache.put(key, 'e', result, 0.0)
+    # Touch the oldest entry so the second one becomes least recently used
+    cache.get(keys[0])
+    cache.put(keys[3], 'e', result, 0.0)
+
+    assert keys[1] not in cache
+    assert keys[0] in cache and keys[2] in cache and keys[3] in cache
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_make_key_depends_on_every_input():
+    base = ExperimentCache.make_key('e', 'HELLO', (MATRIX, 4), {'seed': 0}, 'v1')
+    variants = [
+        ExperimentCache.make_key('e', 'HELLP', (MATRIX, 4), {'seed': 0}, 'v1'),
+        ExperimentCache.make_key('e', 'HELLO', ([[1, 0], [0, 1]], 4), {'seed': 0}, 'v1'),
+        ExperimentCache.make_key('e', 'HELLO', (MATRIX, 5), {'seed': 0}, 'v1'),
+        ExperimentCache.make_key('e', 'HELLO', (MATRIX, 4), {'seed': 1}, 'v1'),
+        ExperimentCache.make_key('e', 'HELLO', (MATRIX, 4), {'seed': 0}, 'v2'),
+    ]
+    assert base == ExperimentCache.make_key('e', 'HELLO', (MATRIX, 4), {'seed': 0}, 'v1')
+    assert len(set(variants) | {base}) == len(variants) + 1
+
+
+@pytest.mark.parametrize('contents', [b'PK\x03\x04garbage', b'not a zip file', b''])
+def test_recovers_from_corrupt_file(tmp_path, contents):
+    (tmp_path / CACHE_FILENAME).write_bytes(contents)
+
+    cache = ExperimentCache(str(tmp_path))
+    assert len(cache) == 0
+
+    key = cache.make_key('e', 'HELLO', None)
+    cache.put(key, 'e', {'ok': True}, 0.0)
+    cache.flush()
+    assert ExperimentCache(str(tmp_path)).get(key) == {'ok': True}
+
+
+def test_recovers_from_truncated_file(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    for i in range(20):
+        cache.put(cache.make_key('e', str(i), None), 'e', {'i': i}, 0.0)
+    cache.flush()
+
+    path = tmp_path / CACHE_FILENAME
+    path.write_bytes(path.read_bytes()[:300])
+    assert len(ExperimentCache(str(tmp_path))) == 0
+
+
+def test_ignores_file_with_mismatched_columns(tmp_path):
+    np.savez(
+        str(tmp_path / CACHE_FILENAME),
+        keys_data=np.frombuffer(b'ab', dtype=np.uint8),
+        keys_lengths=np.array([1, 1]),
+        experiments_data=np.frombuffer(b'e', dtype=np.uint8),
+        experiments_lengths=np.array([1]),
+        results_data=np.frombuffer(b'{}', dtype=np.uint8),
+        results_lengths=np.array([2]),
+        compute_times=np.zeros(1), accessed=np.zeros(1),
+    )
+    assert len(ExperimentCache(str(tmp_path))) == 0
+
+
+def test_large_result_does_not_pad_other_rows(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    for i in range(100):
+        cache.put(cache.make_key('e', str(i), None), 'e', {'i': i}, 0.0)
+    cache.put(cache.make_key('e', 'big', None), 'e', {'v': 'x' * 100_000}, 0.0)
+    cache.flush()
+
+    with np.load(cache.path) as data:
+        assert data['results_data'].dtype == np.uint8
+        assert data['results_data'].nbytes < 100_000 + 100 * 20
+    assert ExperimentCache(str(tmp_path)).get(cache.make_key('e', '7', None)) == {'i': 7}
+
+
+def test_max_bytes_counts_keys_and_overhead(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    key = cache.make_key('e', 'HELLO', None)
+    cache.put(key, 'e', {}, 0.0)
+    assert cache.total_bytes > len(key) + len('e') + len('{}')
+
+
+def test_load_evicts_down_to_smaller_budget(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    keys = [cache.make_key('e', str(i), None) for i in range(10)]
+    for key in keys:
+        cache.put(key, 'e', {'v': 'x' * 40}, 0.0)
+    cache.flush()
+
+    smaller = ExperimentCache(str(tmp_path), max_bytes=cache.total_bytes // 2)
+    assert smaller.total_bytes <= smaller.max_bytes
+    assert keys[-1] in smaller and keys[0] not in smaller
+    smaller.flush()
+    assert len(ExperimentCache(str(tmp_path))) == len(smaller)
+
+
+def test_cached_none_is_a_hit(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    calls = []
+    key = cache.make_key('e', 'HELLO', None)
+
+    def compute():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_compute(key, 'e', compute) == (None, False)
+    assert cache.get_or_compute(key, 'e', compute) == (None, True)
+    assert len(calls) == 1
+
+
+def _load_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_code_version_tracks_source(tmp_path):
+    path = tmp_path / 'experiment_module.py'
+    path.write_text("def run():\n    return 1\n")
+    before = code_version(_load_module(path, 'experiment_module_a').run)
+
+    path.write_text("def run():\n    return 1 + 1\n")
+    after = code_version(_load_module(path, 'experiment_module_b').run)
+
+    assert before != after
+    assert after == code_version(_load_module(path, 'experiment_module_c').run)
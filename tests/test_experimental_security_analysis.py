@@ -0,0 +1,72 @@
+"""Tests for the cached experiment runner."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# The analysis module imports plotting/stats packages not in requirements.txt
+pytest.importorskip('matplotlib')
+pytest.importorskip('scipy')
+
+from experiment_cache import ExperimentCache
+from experimental_security_analysis import ExperimentalSecurityAnalysis
+
+
+PLAINTEXT = 'THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG'
+
+
+def _sweep(analyzer, graph_sizes=(2, 3), message_lengths=(5, 8)):
+    return analyzer.run_brute_force_sweep(PLAINTEXT, graph_sizes=list(graph_sizes),
+                                          message_lengths=list(message_lengths),
+                                          max_attempts=5)
+
+
+def _without_timing(results):
+    return {point: {k: v for k, v in result.items() if k != 'time_taken'}
+            for point, result in results.items()}
+
+
+def test_second_sweep_is_all_hits(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    first = _sweep(ExperimentalSecurityAnalysis(cache=cache))
+    assert cache.misses == 4
+
+    reopened = ExperimentCache(str(tmp_path))
+    second = _sweep(ExperimentalSecurityAnalysis(cache=reopened))
+    assert reopened.misses == 0
+    assert reopened.hits == 4
+    assert second == first
+
+
+def test_sweep_is_reproducible_without_cache(tmp_path):
+    cached = _sweep(ExperimentalSecurityAnalysis(cache=ExperimentCache(str(tmp_path))))
+    fresh = _sweep(ExperimentalSecurityAnalysis())
+    assert _without_timing(fresh) == _without_timing(cached)
+
+
+def test_widened_sweep_only_computes_new_points(tmp_path):
+    cache = ExperimentCache(str(tmp_path))
+    analyzer = ExperimentalSecurityAnalysis(cache=cache)
+    _sweep(analyzer)
+
+    misses = cache.misses
+    _sweep(analyzer, graph_sizes=(2, 3, 4), message_lengths=(5, 8, 12))
+    # 3x3 grid minus the 2x2 points already cached
+    assert cache.misses - misses == 5
+
+
+def test_code_change_invalidates_entries(tmp_path):
+    class PatchedAnalysis(ExperimentalSecurityAnalysis):
+        def caesar_cipher_decrypt(self, ciphertext, shift):
+            return super().caesar_cipher_decrypt(ciphertext, shift)
+
+    cache = ExperimentCache(str(tmp_path))
+    _sweep(ExperimentalSecurityAnalysis(cache=cache))
+    assert ExperimentalSecurityAnalysis()._code_version() != PatchedAnalysis()._code_version()
+
+    misses = cache.misses
+    _sweep(PatchedAnalysis(cache=cache))
+    assert cache.misses - misses == 4